@@ -7,14 +7,13 @@ Usage:
     python3 bikeshare.py
 """
 import os
-from os.path import isfile
+import sys
 import time
+import numpy as np
 import pandas as pd
-from threading import Thread
-
-def is_csv_file(file):
-    """Determines whether a file is a CSV file by the file extension"""
-    return isfile(file) and file[-4:] == '.csv'
+import pyarrow as pa
+import pyarrow.csv
+from threading import Event, Thread
 
 def get_city_name(csv_name):
     """
@@ -91,40 +90,49 @@ def generate_name_prompts(names):
         (list) prompts - A list of prompts, each including a name and its abbreviation.
         (dict) abbreviations - A mapping of names by their abbreviations.
     """
-    potential_abbreviations = {}
+    abbreviations = {}
+    abbreviation_map = {}
+    plain_names = []
     for name in names:
         # Capture a 'catch all' option
         if name.find('not') != -1:
-            potential_abbreviations['none'] = name
-            continue
+            abbreviations['none'] = name
+            abbreviation_map[name] = 'none'
         elif name.find('all') != -1:
-            potential_abbreviations['all'] = name
-            continue
-        # Build up the abbreviation of the word until a unique abbreviation is found, thus far
-        for length in range(1, len(name) + 1):
-            first_part = name[:length]
-            if not first_part in potential_abbreviations:
-                # No clash
-                potential_abbreviations[first_part] = name
+            abbreviations['all'] = name
+            abbreviation_map[name] = 'all'
+        else:
+            plain_names.append(name)
+    # Build a character trie over the remaining names, counting how many
+    # names pass through each node. The shortest unique abbreviation of a
+    # name is its prefix at the first node only that name passes through.
+    root = {}
+    for name in plain_names:
+        node = root
+        for char in name:
+            node = node.setdefault(char, {'_count': 0})
+            node['_count'] += 1
+    for name in plain_names:
+        node = root
+        # A name that is a prefix of another falls back to the full name
+        abbreviation = name
+        for length, char in enumerate(name, start=1):
+            node = node[char]
+            if node['_count'] == 1:
+                abbreviation = name[:length]
                 break
-            else:
-                # A clash was found
-                previous_name = potential_abbreviations[first_part]
-                if not previous_name == None:
-                    # Mark the duplicate abbreviation and update it with the next potential on for that word
-                    potential_abbreviations[first_part] = None
-                    potential_abbreviations[previous_name[:length + 1]] = previous_name
-    # Generate the prompts and mapping of abbreviations to their corresponding name
-    abbreviations = {}
-    abbreviation_map = {}
-    for key, value in potential_abbreviations.items():
-        if not value == None:
-            abbreviations[key] = value
-            abbreviation_map[value] = key
+        abbreviations[abbreviation] = name
+        abbreviation_map[name] = abbreviation
     prompts = ['{} [{}]'.format(name, abbreviation_map[name]) for name in names]
 
     return prompts, abbreviations
 
+# The prompt builder to use for each type of abbreviation
+_PROMPT_BUILDERS = {
+    ACRONYMN: generate_city_prompts,
+    PROPER_NAME: generate_name_prompts,
+}
+
 def build_options(names, abbreviation_type):
     """
     Build the prompt options derived from the list of names to filter upon,
@@ -136,23 +144,19 @@ def build_options(names, abbreviation_type):
                     ACRONYMN or PROPER_NAME
     Returns:
         (str) options - The options to choose from that will be displayed in the prompt.`
-        (dict) abbreviations - A mapping of names by their abbreviations.
+        (dict) by_abbreviation - A mapping of lowercased abbreviations to names.
+        (dict) by_name - A mapping of lowercased names to names.
     """
-    if abbreviation_type == ACRONYMN:
-        # A list of city names has been supplied
-        prompts, abbreviations = generate_city_prompts(names)
-    else:
-        # A list of names has been supplied
-        prompts, abbreviations = generate_name_prompts(names)
-    if len(prompts) == 1:
-        city_part = prompts[0]
-    else:
-        # String the options together
-        first = prompts[:-1]
-        first_part = ', '.join(first)
-        last = prompts[-1]
-        options = ' or '.join([first_part, last])
-    return options, abbreviations
+    prompts, abbreviations = _PROMPT_BUILDERS[abbreviation_type](names)
+    # String the options together. A single expression leaves no branch
+    # in which options goes unassigned, which a lone prompt used to hit.
+    options = (prompts[0] if len(prompts) == 1
+               else ', '.join(prompts[:-1]) + ' or ' + prompts[-1])
+    # Precompute lowercased lookup tables so matching a response is a
+    # hash lookup rather than a scan that lowercases every option
+    by_abbreviation = {key.lower(): value for key, value in abbreviations.items()}
+    by_name = {value.lower(): value for value in abbreviations.values()}
+    return options, by_abbreviation, by_name
 
 # https://stackoverflow.com/questions/287871/how-do-i-print-colored-text-to-the-terminal
 TC_HEADER = '\033[95m'
@@ -174,7 +178,8 @@ def colour(string, terminal_colour):
     Returns:
         The string with the colour applied
     """
-    return '{}{}{}'.format(terminal_colour, string, TC_ENDC)
+    # Direct concatenation skips str.format's template parsing
+    return terminal_colour + string + TC_ENDC
 
 def show_prompt(names, abbreviation_type, beginning):
     """
@@ -188,17 +193,13 @@ def show_prompt(names, abbreviation_type, beginning):
     Returns:
         (str) The response made to the prompt.
     """
-    word_part, prompt_map = build_options(names, abbreviation_type)
+    word_part, by_abbreviation, by_name = build_options(names, abbreviation_type)
     # Prompt a maximum of 3 times
     MAX_PROMPTS = 3
     for index in range(0, MAX_PROMPTS):
         raw = input(colour('\n{} {}?\n> '.format(beginning, word_part), TC_OKCYAN))
-        selected = None
-        for key, value in prompt_map.items():
-            lowercase = raw.lower()
-            if lowercase == key.lower() or lowercase == value.lower():
-                selected = value
-                break
+        lowercase = raw.lower()
+        selected = by_abbreviation.get(lowercase) or by_name.get(lowercase)
         if selected is not None:
             break
     if selected is None:
@@ -215,11 +216,17 @@ def create_city_csv_list(project_path):
     Returns:
         list(str) The names of the CSV files found.
     """
-    csv_files = [file for file in os.listdir(project_path) if is_csv_file(file)]
-    return csv_files
-
-WEEKDAYS = ['Monday','Tuesday','Wednesday','Thursday','Friday', 'Saturday', 'Sunday', 'all']
-MONTHS = ['January','February','March','April','May', 'June', 'all']
+    # scandir reuses the directory entry's cached file type, avoiding a
+    # stat call per entry
+    with os.scandir(project_path) as entries:
+        return [entry.name for entry in entries
+                if entry.is_file() and entry.name.endswith('.csv')]
+
+WEEKDAYS = ('Monday','Tuesday','Wednesday','Thursday','Friday', 'Saturday', 'Sunday', 'all')
+MONTHS = ('January','February','March','April','May', 'June', 'all')
+# The display labels, without the 'all' prompt sentinel
+_WEEKDAY_LABELS = WEEKDAYS[:-1]
+_MONTH_LABELS = MONTHS[:-1]
 ALL = -1
 
 def get_filters(dataset, project_path):
@@ -281,43 +288,59 @@ def get_filters(dataset, project_path):
     return get_csv_name(city), month, day
 
 
-# Create a thread to display a progress prompt
-# https://www.geeksforgeeks.org/start-and-stop-a-thread-in-python/
-wait, thread, kill = False, None, False
-
-def stop_waiting(kill_thread=False):
+class Spinner:
     """
-    Stop the thread used to render the progress prompt
+    Displays an animated progress indicator on a background thread.
 
-    Args:
-        (boolean) kill_thread - Kill the thread immediately
-    """
-    global wait
-    global thread
-    global kill
-    wait = False
-    kill = kill_thread
-    if not thread is None:
-        thread.join()
-        thread = None
-    kill = False
-
-def show_on_wait():
+    The thread blocks on an Event with a 0.1 second timeout instead of
+    polling global flags, so stopping the spinner cancels it within one
+    tick rather than waiting out the remainder of the animation cycle.
     """
-    Create a thread that will display a progress indicator on a timer.
-    By default the indicator will finish its cycle before it terminates.
-    """
-    def run(arg):
-        global wait
-        global kill
-        min_intervals = 48
-        max_intervals = 48
+
+    # Only animate for dataframes large enough for the work to be
+    # noticeable; creating and joining a thread costs more than a stats
+    # calculation that finishes in well under a tick.
+    MIN_ROWS = 500_000
+
+    def __init__(self):
+        self._stop_event = Event()
+        self._thread = None
+
+    def start(self, row_count=None):
+        """
+        Start the progress indicator.
+
+        Args:
+            (int) row_count - The number of rows about to be processed,
+                              or None when the amount of work is unknown.
+                              Small row counts skip the indicator.
+        """
+        if row_count is not None and row_count <= self.MIN_ROWS:
+            return
+        self._stop_event.clear()
+        self._thread = Thread(target=self._run)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the progress indicator and wait for its thread to exit"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
         max_chars = 20
         highlight = 'oooo'
-        for i in range(max_intervals):
-            if kill or (not wait and i >= min_intervals):
-                break
-            time.sleep(0.1)
+        # Precompute the colour prefix and suffix once; the loop below
+        # runs every tick and only the dot counts change. Writing to
+        # stdout directly skips print's argument handling and lock.
+        prefix = TC_OKCYAN + ' '
+        suffix = TC_ENDC + '\r'
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        i = 0
+        while not self._stop_event.wait(0.1):
             highlight_length = len(highlight)
             iteration = i % (max_chars + highlight_length)
             left = iteration - highlight_length
@@ -329,16 +352,14 @@ def show_on_wait():
             num_highlights = min(max_chars, right) - max(0, left)
             # The number of dots to the right of the highlight
             num_right = max_chars - (num_left + num_highlights)
-            print(colour(' {}{}{}\r'.format('.' * num_left, highlight[:num_highlights], '.' * num_right), TC_OKCYAN), end='')
-        wait = False
-        print(' ' * (max_chars + 2), end='')
+            write(prefix + '.' * num_left + highlight[:num_highlights]
+                  + '.' * num_right + suffix)
+            flush()
+            i += 1
+        write(' ' * (max_chars + 2))
 
-    # Start the progress indicator 
-    global wait
-    global thread
-    wait = True
-    thread = Thread(target = run, args =(10, ))
-    thread.start()
+# The progress indicator shared by the loading and statistics steps
+spinner = Spinner()
 
 # The name of time columns
 HOUR_COLUMN = 'hour'
@@ -348,21 +369,71 @@ GENDER_COLUMN = 'Gender'
 DOB_COLUMN = 'Birth Year'
 USER_COLUMN = 'User Type'
 
-def filter_by_time(df, column, selected):
+# The CSV columns the statistics functions actually read, and the dtypes
+# to parse them with. Categoricals keep the repeated station/user/gender
+# strings in a small dictionary rather than one Python string per row.
+CSV_COLUMNS = ['Start Time', 'Start Station', 'End Station', 'Trip Duration',
+               USER_COLUMN, GENDER_COLUMN, DOB_COLUMN]
+CSV_ARROW_TYPES = {
+    'Start Time': pa.timestamp('ns'),
+    'Start Station': pa.string(),
+    'End Station': pa.string(),
+    'Trip Duration': pa.float32(),
+    USER_COLUMN: pa.string(),
+    GENDER_COLUMN: pa.string(),
+    DOB_COLUMN: pa.float32(),
+}
+
+def filter_by_time(df, month, day):
     """
-    Applies a time filter to a Pandas data frame
+    Applies the selected month and day filters to a Pandas data frame
     Args:
         (pandas.DataFrame) df - The data frame to filter
-        (str) column - The column to drop as a result of applying the filter
-        (str) selected - The selected period on which to filter
-    
+        (int) month - The index of the month to filter by, or -1 for no filter
+        (int) day - The index of the day of week to filter by, or -1 for no filter
+
     Returns:
-        The filtered data frame
+        The filtered data frame, with the filtered columns dropped
     """
-    if selected != ALL:
-        df = df[df[column] == selected]
-        df.drop(columns=column, inplace=True)
-    return df
+    if month == ALL and day == ALL:
+        return df
+    # Combine both filters into one boolean mask so the dataframe rows
+    # are copied at most once. Comparing on the underlying NumPy arrays
+    # keeps the comparisons vectorized.
+    mask = np.ones(len(df), dtype=bool)
+    filtered_columns = []
+    if month != ALL:
+        mask &= df[MONTH_COLUMN].values == month
+        filtered_columns.append(MONTH_COLUMN)
+    if day != ALL:
+        mask &= df[WEEKDAY_COLUMN].values == day
+        filtered_columns.append(WEEKDAY_COLUMN)
+    # A column that has been filtered on holds a single value and is
+    # dropped, so leave it out of the result instead of copying its
+    # surviving rows only to drop them afterwards
+    kept_columns = [column for column in df.columns
+                    if column not in filtered_columns]
+    return df.loc[mask, kept_columns]
+
+def cache_is_current(df):
+    """
+    Determines whether a cached dataframe was written by this revision
+    of the loader
+
+    Args:
+        (pandas.DataFrame) df - The data frame read back from a cache
+
+    Returns:
+        (boolean) True if the frame carries the derived columns and
+        dtypes the statistics functions rely on
+    """
+    derived_columns = (MONTH_COLUMN, WEEKDAY_COLUMN, HOUR_COLUMN)
+    if not all(column in df.columns and df[column].dtype == np.int8
+               for column in derived_columns):
+        return False
+    return all(isinstance(df[column].dtype, pd.CategoricalDtype)
+               for column in ('Start Station', 'End Station')
+               if column in df.columns)
 
 def load_data(csv, month, day):
     """
@@ -378,22 +449,53 @@ def load_data(csv, month, day):
         df - Pandas DataFrame containing city data filtered by month and day
     """
     print(colour('\nLoading data...', TC_OKCYAN))
-    show_on_wait()
-    # Load data file for the selected city into a dataframe
-    df = pd.read_csv(csv)
-
-    # Convert the Start Time column to datetime
-    df['Start Time'] = pd.to_datetime(df['Start Time'])
-
-    # Extract month and day of week from Start Time to create new columns
-    df[MONTH_COLUMN] = df['Start Time'].dt.month
-    df[WEEKDAY_COLUMN] = df['Start Time'].dt.dayofweek
-    df[HOUR_COLUMN] = df['Start Time'].dt.hour
+    spinner.start()
+    cache = '{}.parquet'.format(csv)
+    df = None
+    if os.path.isfile(cache) and os.stat(cache).st_mtime >= os.stat(csv).st_mtime:
+        # A cached copy of the parsed CSV exists and is up to date.
+        # Reading it back restores the datetime and derived columns
+        # without re-parsing the CSV. A sidecar written by an older
+        # revision may lack those columns or dtypes, in which case it
+        # is discarded and rebuilt below.
+        df = pd.read_parquet(cache)
+        if not cache_is_current(df):
+            df = None
+    if df is None:
+        # Parse the CSV with pyarrow's multithreaded native reader,
+        # loading only the columns the statistics functions use. Not
+        # every city CSV has the Gender/Birth Year columns, so take the
+        # intersection with the header first. Start Time comes back
+        # already parsed as timestamps, so no separate pd.to_datetime
+        # pass is needed, and strings_to_categorical keeps the station,
+        # user type and gender columns categorical.
+        header = pd.read_csv(csv, nrows=0).columns
+        usecols = [column for column in CSV_COLUMNS if column in header]
+        table = pyarrow.csv.read_csv(
+            csv,
+            convert_options=pyarrow.csv.ConvertOptions(
+                include_columns=usecols, column_types=CSV_ARROW_TYPES))
+        df = table.to_pandas(strings_to_categorical=True)
+
+        # Extract month, day of week and hour from Start Time to create
+        # new columns. Hour and weekday are plain integer arithmetic on
+        # the int64 nanosecond values (the epoch was a Thursday, hence
+        # the +3 offset to a Monday-based weekday); month needs calendar
+        # arithmetic so it keeps the .dt accessor. int8 results cut the
+        # memory traffic of the downstream filter and mode passes.
+        ts = df['Start Time'].values.view('i8')
+        df[MONTH_COLUMN] = df['Start Time'].dt.month.astype(np.int8)
+        days = ts // 86_400_000_000_000
+        df[WEEKDAY_COLUMN] = ((days + 3) % 7).astype(np.int8)
+        df[HOUR_COLUMN] = ((ts // 3_600_000_000_000) % 24).astype(np.int8)
+
+        # Cache the parsed dataframe, derived columns included, so that
+        # subsequent runs on this city skip the CSV and datetime parsing
+        df.to_parquet(cache, compression='snappy')
 
     # Filter by the seleted time frame
-    df = filter_by_time(df, MONTH_COLUMN, month)
-    df = filter_by_time(df, WEEKDAY_COLUMN, day)
-    stop_waiting()
+    df = filter_by_time(df, month, day)
+    spinner.stop()
     return df
 
 def time_stats(df):
@@ -404,31 +506,36 @@ def time_stats(df):
     start_time = time.time()
 
     output = []
-    show_on_wait()
+    spinner.start(len(df))
+    # The time columns hold small non-negative integers (months 1-12,
+    # weekdays 0-6, hours 0-23), so their mode is a single bincount
+    # pass and an argmax over at most 24 bins rather than pandas'
+    # generic hash-based mode.
     # display the most common month
     if MONTH_COLUMN in df.columns:
-        month_index = df[MONTH_COLUMN].mode()[0]
-        month = MONTHS[month_index - 1]
+        month_index = int(np.bincount(df[MONTH_COLUMN].to_numpy()).argmax())
+        month = _MONTH_LABELS[month_index - 1]
         output.append('\nThe most popular month of departure is {}.'.format(month))
 
     # display the most common day of week
     if WEEKDAY_COLUMN in df.columns:
-        weekday_index = df[WEEKDAY_COLUMN].mode()[0]
-        weekday = WEEKDAYS[weekday_index]
+        weekday_index = int(np.bincount(df[WEEKDAY_COLUMN].to_numpy()).argmax())
+        weekday = _WEEKDAY_LABELS[weekday_index]
         output.append('\nThe most popular day of departure is {}.'.format(weekday))
 
     # display the most common start hour
-    hour = df[HOUR_COLUMN].mode()[0]
+    hour = int(np.bincount(df[HOUR_COLUMN].to_numpy()).argmax())
     hour_label = hour % 12 or '12'
     hour_string = '{}{}'.format(hour_label, 'am' if hour < 12 else 'pm')
     output.append('\nThe most common hour of departure is {}'.format(hour_string))
 
     output.append("\nThis took %s seconds." % (time.time() - start_time))
-    stop_waiting()
+    spinner.stop()
+    separator = colour('-' * len(notice), TC_OKCYAN)
     print(colour('\n'.join(output), TC_OKCYAN))
-    print(colour('-' * len(notice), TC_OKCYAN))
-    prompt_for_raw_stats(df.filter(['Start Time'], axis=1))
-    print(colour('-' * len(notice), TC_OKCYAN))
+    print(separator)
+    prompt_for_raw_stats(df, ['Start Time'])
+    print(separator)
 
 def station_stats(df):
     """Displays statistics on the most popular stations and trip."""
@@ -438,23 +545,33 @@ def station_stats(df):
     start_time = time.time()
 
     output = []
-    show_on_wait()
+    spinner.start(len(df))
     # display most commonly used start station
     output.append('\nThe most commonly used start station is {}'.format(df['Start Station'].mode()[0]))
 
     # display most commonly used end station
     output.append('\nThe most commonly used end station is {}'.format(df['End Station'].mode()[0]))
 
-    # display most frequent combination of start station and end station trip
-    df['start_to_end_trip'] = df['Start Station'] + ' to ' +  df['End Station']
-    output.append('\nThe most frequent combination of start station and end station trip is {}'
-        .format(df['start_to_end_trip'].mode()[0]))
+    # display most frequent combination of start station and end station trip.
+    # Rather than concatenating the two string columns row by row, pack the
+    # two category codes into one int64 and count the packed keys, then map
+    # the winning pair back to its station labels.
+    start_codes = df['Start Station'].cat.codes.to_numpy().astype(np.int64)
+    end_codes = df['End Station'].cat.codes.to_numpy().astype(np.int64)
+    packed = (start_codes << 32) | end_codes
+    values, counts = np.unique(packed, return_counts=True)
+    top = values[counts.argmax()]
+    start_label = df['Start Station'].cat.categories[top >> 32]
+    end_label = df['End Station'].cat.categories[top & 0xffffffff]
+    output.append('\nThe most frequent combination of start station and end station trip is {} to {}'
+        .format(start_label, end_label))
     output.append("\nThis took %s seconds." % (time.time() - start_time))
-    stop_waiting()
+    spinner.stop()
+    separator = colour('-' * len(notice), TC_OKCYAN)
     print(colour('\n'.join(output), TC_OKCYAN))
-    print(colour('-' * len(notice), TC_OKCYAN))
-    prompt_for_raw_stats(df[['Start Station', 'End Station']])
-    print(colour('-' * len(notice), TC_OKCYAN))
+    print(separator)
+    prompt_for_raw_stats(df, ['Start Station', 'End Station'])
+    print(separator)
 
 def trip_duration_stats(df):
     """Displays statistics on the total and average trip duration."""
@@ -464,19 +581,25 @@ def trip_duration_stats(df):
     start_time = time.time()
 
     output = []
-    show_on_wait()
+    spinner.start(len(df))
+    # The durations are stored as float32; accumulate in float64 so the
+    # displayed totals stay exact over hundreds of thousands of rows
+    durations = df['Trip Duration'].to_numpy()
     # display total travel time
-    output.append('\nThe total travel time is {} seconds'.format(round(df['Trip Duration'].sum())))
+    output.append('\nThe total travel time is {} seconds'.format(
+        round(durations.sum(dtype=np.float64))))
 
     # display mean travel time
-    output.append('\nThe mean travel time is {} seconds'.format(round(df['Trip Duration'].mean())))
+    output.append('\nThe mean travel time is {} seconds'.format(
+        round(durations.mean(dtype=np.float64))))
 
     output.append("\nThis took %s seconds." % (time.time() - start_time))
-    stop_waiting()
+    spinner.stop()
+    separator = colour('-' * len(notice), TC_OKCYAN)
     print(colour('\n'.join(output), TC_OKCYAN))
-    print(colour('-' * len(notice), TC_OKCYAN))
-    prompt_for_raw_stats(df[['Trip Duration']])
-    print(colour('-' * len(notice), TC_OKCYAN))
+    print(separator)
+    prompt_for_raw_stats(df, ['Trip Duration'])
+    print(separator)
 
 def user_stats(df):
     """Displays statistics on bikeshare users."""
@@ -486,48 +609,69 @@ def user_stats(df):
     start_time = time.time()
 
     output = []
-    show_on_wait()
+    spinner.start(len(df))
     # Display counts of user types
+    # to_dict walks the index and counts arrays once at the C level and
+    # preserves value_counts' descending order
     value_counts = df[USER_COLUMN].value_counts()
-    kinds = value_counts.index.tolist()
     columns_to_show_raw_data = [USER_COLUMN]
     output.append('\nCounts of user types\n')
-    output += ['{}: {}'.format(kind, value_counts[kind]) for kind in kinds]
+    output += [f'{kind}: {count}'
+               for kind, count in value_counts.to_dict().items() if count]
 
     # Display counts of gender
     if GENDER_COLUMN in df.columns:
         value_counts = df[GENDER_COLUMN].value_counts()
-        kinds = value_counts.index.tolist()
         output.append('\nCounts of genders\n')
-        output += ['{}: {}'.format(kind, value_counts[kind]) for kind in kinds]
+        output += [f'{kind}: {count}'
+                   for kind, count in value_counts.to_dict().items() if count]
         columns_to_show_raw_data.append(GENDER_COLUMN)
 
     # Display earliest, most recent, and most common year of birth
     if DOB_COLUMN in df.columns:
-        dobs = df[DOB_COLUMN].dropna(axis = 0).astype(int)
-        value_counts = dobs.value_counts()
-        kinds = value_counts.index.tolist()
-        output.append('\nCounts of year of birth\n')
-        output += ['{}: {}'.format(kind, value_counts[kind]) for kind in kinds]
+        years = df[DOB_COLUMN].to_numpy()
+        valid = years[~np.isnan(years)]
+        if len(valid) > 0:
+            earliest = int(valid.min())
+            latest = int(valid.max())
+            # Birth years span a small range, so the mode is a bincount
+            # over the offsets from the earliest year
+            most_common = earliest + int(
+                np.bincount(valid.astype(np.int32) - earliest).argmax())
+            output.append('\nThe earliest year of birth is {}'.format(earliest))
+            output.append('The most recent year of birth is {}'.format(latest))
+            output.append('The most common year of birth is {}'.format(most_common))
         columns_to_show_raw_data.append(DOB_COLUMN)
 
     output.append("\nThis took %s seconds." % (time.time() - start_time))
-    stop_waiting()
+    spinner.stop()
+    separator = colour('-' * len(notice), TC_OKCYAN)
     print(colour('\n'.join(output), TC_OKCYAN))
-    print(colour('-' * len(notice), TC_OKCYAN))
-    prompt_for_raw_stats(df[columns_to_show_raw_data])
-    print(colour('-' * len(notice), TC_OKCYAN))
+    print(separator)
+    prompt_for_raw_stats(df, columns_to_show_raw_data)
+    print(separator)
 
-def prompt_for_raw_stats(df):
-    """Prompts the user for more stats"""
+def prompt_for_raw_stats(df, columns):
+    """
+    Prompts the user to page through the raw data behind a statistic
+
+    Args:
+        (pandas.DataFrame) df - The data frame holding the statistics data
+        (list) columns - The columns of the raw data to display
+    """
     max_rows = 25
     row = 0
     row_count = 5
     display_data = input(colour('\nWould you like to view the raw data?\n> ', TC_HEADER))
     if display_data.lower() == 'yes':
-        while row < max_rows and row < len(df.index):
-            indices = df.index[row:min(row + row_count + 1, len(df.index)) - 1]
-            print(colour(df.loc[indices].to_string(index=False), TC_OKGREEN))
+        # Only project the requested columns once the user has asked to
+        # see them; answering no costs no copy at all. Positional slicing
+        # with iloc pages through as views rather than indexed copies.
+        view = df[columns]
+        # The row count never changes while paging, so compute it once
+        total_rows = len(view)
+        while row < max_rows and row < total_rows:
+            print(colour(view.iloc[row:row + row_count].to_string(index=False), TC_OKGREEN))
             row += row_count
             display_more_data = input(colour('Would you like to view more raw data?\n> ', TC_HEADER))
             if not display_more_data.lower() == 'yes':
@@ -549,11 +693,11 @@ def main():
             trip_duration_stats(df)
             user_stats(df)
         except (EOFError, KeyboardInterrupt) as input_exp:
-            stop_waiting(True)
+            spinner.stop()
             print('\nBye!')
             break
         except Exception as e:
-            stop_waiting(True)
+            spinner.stop()
             print(str(e))
 
         try: